@@ -3,17 +3,19 @@ from .approveaction import ApproveAction
 
 
 class ApproveGroupAction(ApproveAction):
-    APPROVE_MSG = "Approving {request} for group {group}."
+    @staticmethod
+    def approve_msg(request, group):
+        return f"Approving {request} for group {group}."
 
     def get_reviewer(self, reviewer):
         return self.remote.groups.for_name(reviewer)
 
     def validate(self):
-        if self.reviewer not in self.request.groups:
+        if self.reviewer not in self.request.group_set:
             raise NonMatchingGroupsError([self.reviewer], self.request.groups)
 
     def action(self):
         self.validate()
-        msg = self.APPROVE_MSG.format(request=self.request, group=self.reviewer)
+        msg = self.approve_msg(self.request, self.reviewer)
         self.print(msg)
         self.request.review_accept(group=self.reviewer, comment=msg)
@@ -5,19 +5,41 @@ from .approveaction import ApproveAction
 class ApproveUserAction(ApproveAction):
     """Approve a review for a user."""
 
-    APPROVE_MSG = "Approving {request} for {user} ({groups}). " "Testreport: {url}"
-    MORE_GROUPS_MSG = "The following groups could also be reviewed by you: " "{groups}"
+    @staticmethod
+    def approve_msg(request, user, groups, url):
+        return f"Approving {request} for {user} ({groups}). Testreport: {url}"
+
+    @staticmethod
+    def more_groups_msg(groups):
+        return f"The following groups could also be reviewed by you: {groups}"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._in_review_groups = None
+        self._reviewable_groups = None
+
+    @property
+    def in_review_groups(self):
+        """Groups the user is reviewing the request for."""
+        if self._in_review_groups is None:
+            self._in_review_groups = self.user.in_review_groups(self.request)
+        return self._in_review_groups
+
+    @property
+    def reviewable_groups(self):
+        """Groups of the request the user could review for."""
+        if self._reviewable_groups is None:
+            self._reviewable_groups = self.user.reviewable_groups(self.request)
+        return self._reviewable_groups
 
     def get_reviewer(self, reviewer):
         return self.remote.users.by_name(reviewer)
 
     def reviews_assigned(self):
         """Ensure that the user was assigned before accepting."""
-        for review in self.request.assigned_roles:
-            if review.user == self.user:
-                return True
-        else:
+        if self.user.login not in self.request.assigned_roles_by_user:
             raise NotAssignedError(self.user)
+        return True
 
     def validate(self):
         """Check preconditions to be met before a request can be approved.
@@ -31,20 +53,18 @@ class ApproveUserAction(ApproveAction):
 
     def additional_reviews(self):
         """Return groups that could also be reviewed by the user."""
-        return self.user.reviewable_groups(self.request)
+        return self.reviewable_groups
 
     def action(self):
         self.validate()
         url = self.template.fancy_url
-        groups = ", ".join([str(g) for g in self.user.in_review_groups(self.request)])
-        msg = self.APPROVE_MSG.format(
-            user=self.reviewer, groups=groups, request=self.request, url=url
-        )
+        groups = ", ".join(map(str, self.in_review_groups))
+        msg = self.approve_msg(self.request, self.reviewer, groups, url)
         self.print(msg)
         self.request.review_accept(user=self.reviewer, comment=msg)
         try:
-            groups = ", ".join(str(g) for g in self.additional_reviews())
-            msg = self.MORE_GROUPS_MSG.format(groups=groups)
+            groups = ", ".join(map(str, self.additional_reviews()))
+            msg = self.more_groups_msg(groups)
             self.print(msg)
         except NonMatchingUserGroupsError:
             pass
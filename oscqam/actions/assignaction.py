@@ -10,13 +10,6 @@ from .oscaction import OscAction
 
 
 class AssignAction(OscAction):
-    ASSIGN_MSG = "Assigning {user} to {group} for {request}."
-    AUTO_INFER_MSG = "Found a possible group: {group}."
-    MULTIPLE_GROUPS_MSG = (
-        "User could review more than one group: {groups}. "
-        "Specify the group to review using the -G flag."
-    )
-
     def __init__(
         self,
         remote,
@@ -26,17 +19,34 @@ class AssignAction(OscAction):
         template_factory=Template,
         force=False,
         template_required=True,
-        **kwargs
+        **kwargs,
     ):
         super().__init__(remote, user, **kwargs)
         self.request = remote.requests.by_id(request_id)
-        self.groups = (
-            [remote.groups.for_name(group) for group in groups] if groups else None
-        )
+        self.groups = remote.groups.for_names(groups) if groups else None
         self.template_factory = template_factory
         self.template_required = template_required
         self.force = force
 
+    @staticmethod
+    def assign_msg(user, group, request):
+        return f"Assigning {user} to {group} for {request}."
+
+    @staticmethod
+    def assign_failed_msg(user, group, request):
+        return f"Could not assign {user} to {group} for {request}."
+
+    @staticmethod
+    def auto_infer_msg(group):
+        return f"Found a possible group: {group}."
+
+    @staticmethod
+    def multiple_groups_msg(groups):
+        return (
+            f"User could review more than one group: {groups}. "
+            "Specify the group to review using the -G flag."
+        )
+
     def template_exists(self):
         """Check that the template associated with the request exists.
 
@@ -70,13 +80,16 @@ class AssignAction(OscAction):
         ]
         if not declined_requests:
             return
+
+        # The names of the reviews are enough: no need to load the users.
         reviewers = [
-            review.reviewer
-            for review in (request.review_list() for request in declined_requests)
+            review.name
+            for request in declined_requests
+            for review in request.review_list()
             if isinstance(review, UserReview)
         ]
-        if self.user not in reviewers:
-            raise NotPreviousReviewerError(reviewers)
+        if self.user.login not in reviewers:
+            raise NotPreviousReviewerError(", ".join(reviewers))
 
     def validate(self):
         # if tehere isn't open review all other cheks aren't required and can't be overridden by self.force
@@ -102,18 +115,21 @@ class AssignAction(OscAction):
         """
         groups = self.user.reviewable_groups(self.request)
         if len(groups) > 1:
-            raise UninferableError(
-                AssignAction.MULTIPLE_GROUPS_MSG.format(groups=[str(g) for g in groups])
-            )
+            raise UninferableError(self.multiple_groups_msg([str(g) for g in groups]))
         group = groups.pop()
-        self.print(AssignAction.AUTO_INFER_MSG.format(group=group))
+        self.print(self.auto_infer_msg(group))
         return [group]
 
     def assign(self, groups):
         self.validate()
-        for group in groups:
-            msg = AssignAction.ASSIGN_MSG.format(
-                user=self.user, group=group, request=self.request
-            )
-            self.request.review_assign(reviewer=self.user, group=group, comment=msg)
-            self.print(msg)
+        msgs = [self.assign_msg(self.user, group, self.request) for group in groups]
+
+        def report(group, error):
+            if error:
+                self.print(self.assign_failed_msg(self.user, group, self.request))
+            else:
+                self.print(self.assign_msg(self.user, group, self.request))
+
+        self.request.review_assign_many(
+            groups=groups, reviewer=self.user, comments=msgs, report=report
+        )
@@ -3,7 +3,7 @@ from ..fields import ReportField
 
 
 class InfoAction(ListAction):
-    default_fields = [
+    default_fields = (
         ReportField.review_request_id,
         ReportField.srcrpms,
         ReportField.rating,
@@ -13,7 +13,7 @@ class InfoAction(ListAction):
         ReportField.unassigned_roles,
         ReportField.creator,
         ReportField.issues,
-    ]
+    )
 
     def __init__(self, remote, user_id, request_id):
         super().__init__(remote, user_id)
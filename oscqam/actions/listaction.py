@@ -1,11 +1,12 @@
 import abc
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import wait
 import logging
+from operator import attrgetter
 
 from ..errors import TemplateNotFoundError
 from ..fields import ReportField
 from ..models import Template
-from ..utils import multi_level_sort
+from ..utils import thread_pool
 from .oscaction import OscAction
 from .report import Report
 
@@ -17,36 +18,34 @@ class ListAction(OscAction):
     of requests that should be output according to the formatter and fields.
     """
 
-    default_fields = [
+    default_fields = (
         ReportField.review_request_id,
         ReportField.srcrpms,
         ReportField.rating,
         ReportField.products,
         ReportField.incident_priority,
-    ]
+    )
 
     def group_sort_reports(self):
         """Sort reports according to rating and request id.
 
         First sort by Priority, then rating and finally request id.
         """
-        reports = filter(None, self.reports)
-        self.reports = multi_level_sort(
-            reports,
-            [
-                lambda l: l.request.reqid,
-                lambda l: l.template.log_entries["Rating"],
-                lambda l: l.request.incident_priority,
-            ],
-        )
+        # The keys are computed once per report and kept on it, so they are
+        # not looked up again for every comparison.
+        self.reports.sort(key=attrgetter("sort_key"))
 
     def __init__(self, remote, user, template_factory=Template):
         super().__init__(remote, user)
         self.template_factory = template_factory
 
-    def action(self):
-        """Return all reviews that match the parameters of the RequestAction."""
-        self.reports = self._load_listdata(self.load_requests())
+    def action(self, keys=()):
+        """Return all reviews that match the parameters of the RequestAction.
+
+        :param keys: Fields that will be output for the reports.
+        :type keys: [:class:`oscqam.fields.ReportField`]
+        """
+        self.reports = self._load_listdata(self.load_requests(), keys)
         self.group_sort_reports()
         return self.reports
 
@@ -63,16 +62,54 @@ class ListAction(OscAction):
         where the request came from.
 
         """
-        all_requests = user_requests.union(group_requests)
-        for request in all_requests:
-            request.origin = []
-            if request in user_requests:
-                request.origin.append(self.user.login)
-            if request in group_requests:
-                request.origin.extend(request.groups)
-        return all_requests
-
-    def _load_listdata(self, requests):
+        # Collect the origins in one pass per source instead of testing every
+        # request for membership in both sets.
+        origins = {}
+        for request in user_requests:
+            origins[request] = [self.user.login]
+        for request in group_requests:
+            origins.setdefault(request, []).extend(request.groups)
+        for request, origin in origins.items():
+            request.origin = origin
+        return set(origins)
+
+    def filter_requests(self, requests, predicate):
+        """Return the set of requests the predicate holds for.
+
+        Checking the reviews of a request can load reviewers from the remote,
+        so the predicate is evaluated for all requests in parallel.
+
+        :param requests: [:class:`oscqam.models.Request`]
+
+        :param predicate: :class:`oscqam.models.Request` -> bool
+
+        :returns: set(:class:`oscqam.models.Request`)
+        """
+        requests = list(requests)
+        matches = list(thread_pool().map(predicate, requests))
+        return {request for request, match in zip(requests, matches) if match}
+
+    def _load_report(self, request, keys=()):
+        """Create the report for a request.
+
+        The incident priority used to sort the reports and the values of the
+        fields to output (e.g. comments, assigned roles) have to be fetched
+        from the remote as well, so they are loaded here together with the
+        template.
+
+        :param request: :class:`oscqam.models.Request`
+
+        :param keys: Fields whose values should be loaded.
+        :type keys: [:class:`oscqam.fields.ReportField`]
+
+        :returns: :class:`oscqam.actions.Report`
+        """
+        report = Report(request, self.template_factory)
+        for key in (ReportField.incident_priority, *keys):
+            report.value(key)
+        return report
+
+    def _load_listdata(self, requests, keys=()):
         """Load templates for the given requests.
 
         Templates that could not be loaded will print a warning (this can
@@ -81,14 +118,20 @@ class ListAction(OscAction):
 
         :param requests: [:class:`oscqam.models.Request`]
 
-        :returns: :class:`oscqam.actions.Report`-generator
+        :param keys: Fields whose values should be loaded with the reports.
+        :type keys: [:class:`oscqam.fields.ReportField`]
+
+        :returns: [:class:`oscqam.actions.Report`]
         """
-        with ThreadPoolExecutor() as executor:
-            results = [
-                executor.submit(Report, r, self.template_factory) for r in requests
-            ]
-        for promise in as_completed(results):
+        executor = thread_pool()
+        results = [executor.submit(self._load_report, r, keys) for r in requests]
+        # All reports are sorted afterwards, so there is nothing to gain from
+        # handling them in order of completion.
+        wait(results)
+        reports = []
+        for promise in results:
             try:
-                yield promise.result()
+                reports.append(promise.result())
             except TemplateNotFoundError as e:
                 logging.warning(str(e))
+        return reports
@@ -1,11 +1,12 @@
 from ..fields import ReportField
+from ..models import UserReview
 from .listaction import ListAction
 
 
 class ListAssignedAction(ListAction):
     """Action to list assigned requests."""
 
-    default_fields = [
+    default_fields = (
         ReportField.review_request_id,
         ReportField.srcrpms,
         ReportField.rating,
@@ -13,18 +14,16 @@ class ListAssignedAction(ListAction):
         ReportField.incident_priority,
         ReportField.assigned_roles,
         ReportField.creator,
-    ]
+    )
 
     def in_review_by_user(self, reviews):
-        for review in reviews:
-            if review.reviewer == self.user and review.open:
-                return True
-        return False
+        # Compare logins, which does not need to load the reviewing users.
+        login = self.user.login
+        return any(
+            isinstance(review, UserReview) and review.name == login and review.open
+            for review in reviews
+        )
 
     def load_requests(self):
-        qam_groups = [
-            group for group in self.remote.groups.all() if group.is_qam_group()
-        ]
-        return {
-            request for request in self.remote.requests.review_for_groups(qam_groups)
-        }
+        qam_groups = self.remote.groups.qam_groups()
+        return set(self.remote.requests.review_for_groups(qam_groups))
@@ -1,4 +1,4 @@
-from ..models import Template
+from ..models import GroupReview, Template
 from .listassignedaction import ListAssignedAction
 
 
@@ -7,18 +7,17 @@ class ListAssignedGroupAction(ListAssignedAction):
         super().__init__(remote, user, template_factory)
         if not groups:
             raise AttributeError("Can not list groups without any groups.")
-        self.groups = [self.remote.groups.for_name(group) for group in groups]
+        self.groups = self.remote.groups.for_names(groups)
+        self.group_names = frozenset(group.name for group in self.groups)
 
     def in_review(self, reviews):
-        for review in reviews:
-            if review.reviewer in self.groups:
-                return True
-        return False
+        return any(
+            isinstance(review, GroupReview) and review.name in self.group_names
+            for review in reviews
+        )
 
     def load_requests(self):
-        group_requests = set(self.remote.requests.review_for_groups(self.groups))
-        return {
-            request
-            for request in group_requests
-            if self.in_review(request.review_list())
-        }
+        return self.filter_requests(
+            self.remote.requests.review_for_groups(self.groups),
+            lambda request: self.in_review(request.review_list()),
+        )
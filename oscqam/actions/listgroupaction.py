@@ -7,7 +7,7 @@ class ListGroupAction(ListAction):
         super().__init__(remote, user, template_factory)
         if not groups:
             raise AttributeError("Can not list groups without any groups.")
-        self.groups = [self.remote.groups.for_name(group) for group in groups]
+        self.groups = self.remote.groups.for_names(groups)
 
     def load_requests(self):
         return set(self.remote.requests.open_for_groups(self.groups))
@@ -7,17 +7,15 @@ class ListOpenAction(ListAction):
         def assigned(req):
             """Check if the request is assigned to the user that requests the
             listing."""
-            for review in req.assigned_roles:
-                if review.reviewer == self.user:
-                    return True
-            return False
+            return self.user.login in req.assigned_roles_by_user
 
         def filters(req):
             return req.active() and assigned(req)
 
-        user_requests = {
-            req for req in self.remote.requests.for_user(self.user) if filters(req)
-        }
+        # Inferring the assignments loads the users involved from the remote.
+        user_requests = self.filter_requests(
+            self.remote.requests.for_user(self.user), filters
+        )
         qam_groups = self.user.qam_groups
         if not qam_groups:
             raise ReportedError(
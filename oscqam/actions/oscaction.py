@@ -1,4 +1,5 @@
 import abc
+import logging
 import os
 import sys
 
@@ -20,28 +21,51 @@ class OscAction(metaclass=abc.ABCMeta):
         :type out: :class:`file`
         """
         self.remote = remote
-        self.user = remote.users.by_name(user)
+        self._user_name = user
+        self._user = None
         self.undo_stack = []
         self.out = out
+        self._out_buffer = None
+
+    @property
+    def user(self):
+        """The user performing this action.
+
+        Only loaded on first access: some actions (e.g. deleting a comment)
+        never need the user object and can skip the remote lookup.
+        """
+        if not self._user:
+            self._user = self.remote.users.by_name(self._user_name)
+        return self._user
 
     def __call__(self, *args, **kwargs):
         """Will attempt the encapsulated action and call the rollback function if an
         Error is encountered.
 
+        Messages printed while the action runs are written to the out-stream
+        in one go once it is done.
         """
+        self._out_buffer = []
         try:
             return self.action(*args, **kwargs)
         except RemoteError as e:
-            print(str(e))
+            self.flush()
+            logging.error("%s", e)
             self.rollback()
+        finally:
+            self.flush()
 
     @abc.abstractmethod
     def action(self, *args, **kwargs):
         pass
 
     def rollback(self):
-        for action in self.undo_stack:
-            action()
+        """Replay the undo stack.
+
+        Each entry is a ``(function, kwargs)`` pair recorded by the action.
+        """
+        for action, kwargs in self.undo_stack:
+            action(**kwargs)
 
     def print(self, msg, end=os.linesep):
         """Mimick the print-statements behaviour on the out-stream:
@@ -50,6 +74,17 @@ class OscAction(metaclass=abc.ABCMeta):
 
         :type msg: str
         """
+        if self._out_buffer is not None:
+            self._out_buffer.append(msg)
+            self._out_buffer.append(end)
+            return
         self.out.write(msg)
         self.out.write(end)
         self.out.flush()
+
+    def flush(self):
+        """Write the messages buffered while running the action."""
+        if self._out_buffer:
+            self.out.write("".join(self._out_buffer))
+            self.out.flush()
+        self._out_buffer = None
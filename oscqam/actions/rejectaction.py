@@ -13,7 +13,9 @@ class RejectAction(OscAction):
 
     """
 
-    DECLINE_MSG = "Declining request {request} for {user}. See Testreport: {url}"
+    @staticmethod
+    def decline_msg(request, user, url):
+        return f"Declining request {request} for {user}. See Testreport: {url}"
 
     def __init__(
         self, remote, user, request_id, reason, force, message=None, out=sys.stdout
@@ -28,7 +30,7 @@ class RejectAction(OscAction):
     @property
     def template(self):
         if not self._template:
-            self._template = Template(self.request)
+            self._template = self.request.get_template(Template)
         return self._template
 
     def validate(self):
@@ -48,8 +50,6 @@ class RejectAction(OscAction):
             url = self.template.fancy_url
         else:
             url = self.template
-        msg = RejectAction.DECLINE_MSG.format(
-            user=self.user, request=self.request, url=url
-        )
+        msg = self.decline_msg(self.request, self.user, url)
         self.print(msg)
         self.request.review_decline(user=self.user, comment=msg, reasons=self.reason)
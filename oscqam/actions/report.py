@@ -10,10 +10,67 @@ class Report:
 
     """
 
+    __slots__ = ("request", "template", "_values", "_sort_key")
+
     def __init__(self, request, template_factory):
         """Associate a request with the correct template."""
         self.request = request
         self.template = request.get_template(template_factory)
+        self._values = {}
+        self._sort_key = None
+
+    @property
+    def sort_key(self):
+        """Key to order reports by priority, rating and request id."""
+        if self._sort_key is None:
+            self._sort_key = (
+                self.value(ReportField.incident_priority),
+                # Compare the plain rank, not the rating objects.
+                self.value(ReportField.rating).rank,
+                int(self.request.reqid),
+            )
+        return self._sort_key
+
+    def _unassigned_roles(self):
+        # Reviews are only ever created as exactly one of the two review
+        # types, so a type check is enough; each reviewer is looked up once.
+        groups = [
+            review.reviewer
+            for review in self.request.review_list_open()
+            if type(review) is GroupReview
+        ]
+        names = [str(group) for group in groups if group.is_qam_group()]
+        names.sort()
+        return names
+
+    def _package_streams(self):
+        return list(self.request.packages)
+
+    def _assigned_roles(self):
+        return list(map(str, self.request.assigned_roles))
+
+    def _incident_priority(self):
+        return self.request.incident_priority
+
+    def _comments(self):
+        return self.request.comments
+
+    def _creator(self):
+        return self.request.maker
+
+    def _issues(self):
+        return str(len(self.request.issues))
+
+    # Fields that are taken from the request instead of the template.
+    _request_fields = {
+        ReportField.unassigned_roles: _unassigned_roles,
+        ReportField.package_streams: _package_streams,
+        ReportField.assigned_roles: _assigned_roles,
+        ReportField.incident_priority: _incident_priority,
+        ReportField.comments: _comments,
+        ReportField.creator: _creator,
+        ReportField.issues: _issues,
+    }
 
     def value(self, field):
         """Return the values for fields.
@@ -24,27 +81,11 @@ class Report:
 
         :returns: [str]
         """
-        entries = self.template.log_entries
-        if field == ReportField.unassigned_roles:
-            reviews = (
-                review
-                for review in self.request.review_list_open()
-                if isinstance(review, GroupReview) and review.reviewer.is_qam_group()
-            )
-            value = sorted(str(r.reviewer) for r in reviews)
-        elif field == ReportField.package_streams:
-            value = [p for p in self.request.packages]
-        elif field == ReportField.assigned_roles:
-            roles = self.request.assigned_roles
-            value = [str(r) for r in roles]
-        elif field == ReportField.incident_priority:
-            value = self.request.incident_priority
-        elif field == ReportField.comments:
-            value = self.request.comments
-        elif field == ReportField.creator:
-            value = self.request.maker
-        elif field == ReportField.issues:
-            value = str(len(self.request.issues))
-        else:
-            value = entries[str(field)]
-        return value
+        if field not in self._values:
+            handler = self._request_fields.get(field)
+            if handler:
+                value = handler(self)
+            else:
+                value = self.template.log_entries[field.log_key]
+            self._values[field] = value
+        return self._values[field]
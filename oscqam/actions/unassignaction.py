@@ -9,15 +9,22 @@ class UnassignAction(OscAction):
     the group the user assign himself for.
     """
 
-    UNASSIGN_MSG = "Unassigning {user} from {request} for group {group}."
-
     def __init__(self, remote, user, request_id, groups=None, **kwargs):
         super().__init__(remote, user, **kwargs)
         self.request = remote.requests.by_id(request_id)
         if groups:
-            self._groups = [remote.groups.for_name(group) for group in groups]
+            self._groups = remote.groups.for_names(groups)
         else:
             self._groups = None
+        self._review_groups = None
+
+    @staticmethod
+    def unassign_msg(user, group, request):
+        return f"Unassigning {user} from {request} for group {group}."
+
+    @staticmethod
+    def unassign_failed_msg(user, group, request):
+        return f"Could not unassign {user} from {request} for group {group}."
 
     def groups(self):
         if self._groups:
@@ -38,33 +45,26 @@ class UnassignAction(OscAction):
             the user.
 
         """
-        groups = self.user.in_review_groups(self.request)
-        if not groups:
-            raise NoReviewError(self.user)
-        return groups
-
-    def undo_reopen(self, group, comment):
-        def _():
-            self.print("UNDO: Undoing reopening of group {group}".format(group=group))
-            self.request.review_accept(group=group, comment=comment)
-
-        return _
-
-    def undo_accept(self, user):
-        def _():
-            self.print("UNDO: Undoing accepting user {user}".format(user=user))
-            self.request.review_reopen(user=self.user)
-
-        return _
+        if self._review_groups is None:
+            groups = self.user.in_review_groups(self.request)
+            if not groups:
+                raise NoReviewError(self.user)
+            self._review_groups = groups
+        return self._review_groups
 
     # TODO: this action should check and unassign only groups assigned to user..
     def unassign(self, groups, user_assigned_groups):
+        msgs = []
         for group in groups:
-            msg = UnassignAction.UNASSIGN_MSG.format(
-                user=self.user, group=group, request=self.request
-            )
-            self.print(msg)
-            logging.debug(
-                "Reverting assignment from %s back to %s" % (group, self.user)
-            )
-            self.request.review_unassign(reviewer=self.user, group=group, comment=msg)
+            logging.debug("Reverting assignment from %s back to %s", group, self.user)
+            msgs.append(self.unassign_msg(self.user, group, self.request))
+
+        def report(group, error):
+            if error:
+                self.print(self.unassign_failed_msg(self.user, group, self.request))
+            else:
+                self.print(self.unassign_msg(self.user, group, self.request))
+
+        self.request.review_unassign_many(
+            groups=groups, reviewer=self.user, comments=msgs, report=report
+        )
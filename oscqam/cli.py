@@ -1,9 +1,6 @@
 import osc.commandline
 
 
-from oscqam import __version__ as strict_version
-
-
 class QAMCommand(osc.commandline.OscCommand):
     """QE-Maintenace rewiew workflow helper"""
 
@@ -1,6 +1,5 @@
 import osc.commandline
 
-from oscqam.actions import ApproveGroupAction, ApproveUserAction
 from oscqam.common import Common
 
 
@@ -20,6 +19,10 @@ class QAMApproveCommand(osc.commandline.OscCommand, Common):
         self.add_argument("request_id", type=str, help="ID of review request")
 
     def run(self, args):
+        # Actions are only needed once a command runs, not when osc loads
+        # the commands of all its plugins.
+        from oscqam.actions import ApproveGroupAction, ApproveUserAction
+
         self.set_required_params(args)
         if args.group:
             if self.yes_no(
@@ -1,6 +1,5 @@
 import osc.commandline
 
-from oscqam.actions import AssignAction
 from oscqam.common import Common
 from oscqam.errors import NotPreviousReviewerError
 
@@ -35,6 +34,8 @@ class QAMAssignCommand(osc.commandline.OscCommand, Common):
         )
 
     def run(self, args):
+        from oscqam.actions import AssignAction
+
         self.set_required_params(args)
         group = args.group if args.group else None
         template_required = False if args.skip_template else True
@@ -1,12 +1,6 @@
 import osc.commandline
 
-from oscqam.actions import (
-    ListAssignedAction,
-    ListAssignedGroupAction,
-    ListAssignedUserAction,
-)
 from oscqam.common import Common
-from oscqam.errors import ConflictingOptions
 from oscqam.fields import ReportFields
 
 
@@ -33,9 +27,7 @@ class QAMAssignedCommand(osc.commandline.OscCommand, Common):
             "--fields",
             action="append",
             default=[],
-            help="Define the values to output in a cumulative fashion "
-            "(pass flag multiple times).  "
-            "Available fields: " + self.all_columns_string + ".",
+            help=self.fields_help,
         )
         self.add_argument(
             "-U",
@@ -53,16 +45,18 @@ class QAMAssignedCommand(osc.commandline.OscCommand, Common):
             "-V",
             "--describe-fields",
             action="store_true",
-            help="Display all available fields for a request: "
-            + self.all_columns_string
-            + ".",
+            help=self.describe_fields_help,
         )
 
     def run(self, args):
-        if args.verbose and args.fields:
-            raise ConflictingOptions("Only pass '-v' or '-F' not both")
-        if args.user and args.group:
-            raise ConflictingOptions("Only pass '-U' or '-G' not both")
+        from oscqam.actions import (
+            ListAssignedAction,
+            ListAssignedGroupAction,
+            ListAssignedUserAction,
+        )
+
+        self.check_exclusive(args, ("verbose", "-v"), ("fields", "-F"))
+        self.check_exclusive(args, ("user", "-U"), ("group", "-G"))
         self.set_required_params(args)
         fields = ReportFields.review_fields_by_opts(args)
         if args.user:
@@ -1,6 +1,5 @@
 import osc.commandline
 
-from oscqam.actions import CommentAction
 from oscqam.common import Common
 from oscqam.errors import MissingCommentError
 
@@ -19,6 +18,8 @@ class QAMCommentCommand(osc.commandline.OscCommand, Common):
         self.add_argument("comment", nargs="*", type=str, help="Text of comment")
 
     def run(self, args):
+        from oscqam.actions import CommentAction
+
         self.set_required_params(args)
         if not args.comment:
             raise MissingCommentError
@@ -1,8 +1,6 @@
 import osc.commandline
 
-from oscqam.actions import ListGroupAction, ListOpenAction
 from oscqam.common import Common
-from oscqam.errors import ConflictingOptions
 from oscqam.fields import ReportFields
 
 
@@ -23,9 +21,7 @@ class QAMListCommand(osc.commandline.OscCommand, Common):
             "--fields",
             action="append",
             default=[],
-            help="Define the values to output in a cumulative fashion "
-            "(pass flag multiple times).  "
-            "Available fields: " + self.all_columns_string + ".",
+            help=self.fields_help,
         )
         self.add_argument(
             "-T",
@@ -37,9 +33,7 @@ class QAMListCommand(osc.commandline.OscCommand, Common):
             "-V",
             "--describe-fields",
             action="store_true",
-            help="Display all available fields for a request: "
-            + self.all_columns_string
-            + ".",
+            help=self.describe_fields_help,
         )
         self.add_argument(
             "-G",
@@ -58,8 +52,9 @@ class QAMListCommand(osc.commandline.OscCommand, Common):
         )
 
     def run(self, args):
-        if args.describe_fields and args.fields:
-            raise ConflictingOptions("Only pass '-v' or '-F' not both")
+        from oscqam.actions import ListGroupAction, ListOpenAction
+
+        self.check_exclusive(args, ("describe_fields", "-v"), ("fields", "-F"))
         self.set_required_params(args)
         fields = ReportFields.review_fields_by_opts(args)
         if args.group:
@@ -1,8 +1,6 @@
 import osc.commandline
 
-from oscqam.actions import ListAssignedUserAction
 from oscqam.common import Common
-from oscqam.errors import ConflictingOptions
 from oscqam.fields import ReportFields
 
 
@@ -18,9 +16,7 @@ class QAMMyCommand(osc.commandline.OscCommand, Common):
             "--fields",
             action="append",
             default=[],
-            help="Define the values to output in a cumulative fashion "
-            "(pass flag multiple times).  "
-            "Available fields: " + self.all_columns_string + ".",
+            help=self.fields_help,
         )
         self.add_argument(
             "-T",
@@ -32,14 +28,13 @@ class QAMMyCommand(osc.commandline.OscCommand, Common):
             "-V",
             "--describe-fields",
             action="store_true",
-            help="Display all available fields for a request: "
-            + self.all_columns_string
-            + ".",
+            help=self.describe_fields_help,
         )
 
     def run(self, args):
-        if args.describe_fields and args.fields:
-            raise ConflictingOptions("Only pass '-v' or '-F' not both")
+        from oscqam.actions import ListAssignedUserAction
+
+        self.check_exclusive(args, ("describe_fields", "-v"), ("fields", "-F"))
         self.set_required_params(args)
         args.user = self.affected_user
         fields = ReportFields.review_fields_by_opts(args)
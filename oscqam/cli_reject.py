@@ -1,6 +1,5 @@
 import osc.commandline
 
-from oscqam.actions import RejectAction
 from oscqam.common import Common
 from oscqam.reject_reasons import RejectReason
 
@@ -34,6 +33,8 @@ class QAMRejectCommand(osc.commandline.OscCommand, Common):
         )
 
     def run(self, args):
+        from oscqam.actions import RejectAction
+
         message = args.message if args.message else None
         reasons = (
             [RejectReason.from_str(r) for r in args.reason]
@@ -1,6 +1,5 @@
 import osc.commandline
 
-from oscqam.actions import DeleteCommentAction
 from oscqam.common import Common
 from oscqam.errors import InvalidCommentIdError, NoCommentsError
 
@@ -19,18 +18,22 @@ class QAMDeleteCommentCommand(osc.commandline.OscCommand, Common):
         self.add_argument("request_id", type=str, help="ID of review request")
 
     def run(self, args):
+        from oscqam.actions import DeleteCommentAction
+
         self.set_required_params(args)
 
         request = self.api.requests.by_id(args.request_id)
 
-        if not request.comments:
+        # Requests without comments hold a single null comment without id.
+        comments = {c.id: c for c in request.comments if c.id is not None}
+        if not comments:
             raise NoCommentsError()
         print("CommentID: Message")
         print("------------------")
-        for comment in request.comments:
+        for comment in comments.values():
             print("{0}: {1}".format(comment.id, comment.text))
         comment_id = input("Comment-Id to remove: ")
-        if comment_id not in [c.id for c in request.comments]:
-            raise InvalidCommentIdError(comment_id, request.comments)
+        if comment_id not in comments:
+            raise InvalidCommentIdError(comment_id, comments)
         action = DeleteCommentAction(self.api, self.affected_user, comment_id)
         action()
@@ -1,6 +1,5 @@
 import osc.commandline
 
-from oscqam.actions import UnassignAction
 from oscqam.common import Common
 
 
@@ -30,6 +29,8 @@ class QAMUnassignCommand(osc.commandline.OscCommand, Common):
         )
 
     def run(self, args):
+        from oscqam.actions import UnassignAction
+
         self.set_required_params(args)
 
         group = args.group if args.group else None
@@ -1,5 +1,6 @@
 import osc.conf
 
+from oscqam.errors import ConflictingOptions
 from oscqam.fields import ReportFields
 from oscqam.formatters import TabularOutput, VerboseOutput
 from oscqam.reject_reasons import RejectReason
@@ -9,23 +10,43 @@ from oscqam.remotes import RemoteFacade
 class Common:
     SUBQUERY_QUIT = 4
 
-    all_columns_string = ", ".join(str(f) for f in ReportFields.all_fields)
+    all_columns_string = ", ".join(f.log_key for f in ReportFields.all_fields)
     all_reasons_string = ", ".join(r.flag for r in RejectReason)
+    fields_help = (
+        "Define the values to output in a cumulative fashion "
+        "(pass flag multiple times).  "
+        "Available fields: {0}.".format(all_columns_string)
+    )
+    describe_fields_help = "Display all available fields for a request: {0}.".format(
+        all_columns_string
+    )
 
     def set_required_params(self, args):
         self.apiurl = args.apiurl
         self.api = RemoteFacade(self.apiurl)
-        self.affected_user = None
-        if hasattr(args, "user") and args.user:
-            self.affected_user = args.user
-        else:
+        self.affected_user = getattr(args, "user", None)
+        if not self.affected_user:
             self.affected_user = osc.conf.get_apiurl_usr(self.apiurl)
 
+    @staticmethod
+    def check_exclusive(args, *options):
+        """Raise if more than one of the mutually exclusive options was passed.
+
+        :param options: (attribute, flag) pairs for the options.
+
+        :raises: :class:`oscqam.errors.ConflictingOptions`
+        """
+        passed = [flag for attribute, flag in options if getattr(args, attribute)]
+        if len(passed) > 1:
+            flags = " or ".join("'{0}'".format(flag) for flag in passed)
+            raise ConflictingOptions("Only pass {0} not both".format(flags))
+
     def list_requests(self, action, tabular, keys):
-        listdata = action()
+        listdata = action(keys)
+        if not listdata:
+            return
         formatter = TabularOutput() if tabular else VerboseOutput()
-        if listdata:
-            print(formatter.output(keys, listdata))
+        formatter.write(keys, listdata)
 
     @staticmethod
     def yes_no(question: str, default: str = "no") -> bool:
@@ -38,8 +59,9 @@ class Common:
         else:
             default = "n"
             prompt = "[y/N]"
+        question = " ".join([question, prompt])
         while True:
-            answer = input(" ".join([question, prompt])).lower()
+            answer = input(question).lower()
             if not answer:
                 return valid[default]
             elif valid.get(answer, None) is not None:
@@ -66,18 +88,29 @@ class Common:
         :returns: enum selected by the user.
 
         """
-        ids = [tid(member) for member in enum]
-        for member in enum:
-            print("{0}. {1}".format(tid(member), desc(member)))
-        print("q. Quit")
-        user_input = input(
-            "Please specify the options " "(separate multiple values with ,): "
-        )
-        if user_input.lower() == "q":
-            return cls.SUBQUERY_QUIT
-        numbers = [int(s.strip()) for s in user_input.split(",")]
-        for number in numbers:
-            if number not in ids:
-                print("Invalid number specified: {0}".format(number))
-                return cls.query_enum(enum, tid, desc)
-        return [enum.from_id(i) for i in numbers]
+        members = list(enum)
+        if len(members) <= 1:
+            return members
+        ids = {tid(member) for member in members}
+        options = ["{0}. {1}".format(tid(member), desc(member)) for member in members]
+        options.append("q. Quit")
+        menu = "\n".join(options)
+        while True:
+            print(menu)
+            user_input = input(
+                "Please specify the options " "(separate multiple values with ,): "
+            )
+            if user_input.lower() == "q":
+                return cls.SUBQUERY_QUIT
+            try:
+                numbers = [int(s) for s in user_input.split(",") if s.strip()]
+            except ValueError:
+                numbers = []
+            if not numbers:
+                print("Invalid input: {0}".format(user_input))
+                continue
+            invalid = [number for number in numbers if number not in ids]
+            if invalid:
+                print("Invalid number specified: {0}".format(invalid[0]))
+                continue
+            return [enum.from_id(i) for i in numbers]
@@ -7,13 +7,16 @@ from functools import total_ordering
 class Rating:
     """Store a template's rating."""
 
+    __slots__ = ("rating", "rank")
+
     mapping = {"critical": 0, "important": 1, "moderate": 2, "low": 3, "": 4}
 
     def __init__(self, rating):
         self.rating = rating
+        self.rank = self.mapping.get(rating, 10)
 
     def __lt__(self, other):
-        return self.mapping.get(self.rating, 10) < self.mapping.get(other.rating, 10)
+        return self.rank < other.rank
 
     def __eq__(self, other):
         return self.rating == other.rating
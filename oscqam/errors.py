@@ -29,9 +29,7 @@ class NoQamReviewsError(UninferableError):
             (
                 " The following groups were already assigned/finished: "
                 "{msg}".format(
-                    msg=", ".join(
-                        ["{r.reviewer}".format(r=review) for review in accept_reviews]
-                    )
+                    msg=", ".join(str(review.reviewer) for review in accept_reviews)
                 )
             )
             if accept_reviews
@@ -209,8 +207,6 @@ class MissingCommentError(ReportedError):
 
 
 class InvalidCommentIdError(ReportedError):
-    def __init__(self, rid, comments):
-        msg = "Id {0} is not in valid ids: {1}".format(
-            rid, ", ".join([c.id for c in comments])
-        )
+    def __init__(self, rid, ids):
+        msg = "Id {0} is not in valid ids: {1}".format(rid, ", ".join(ids))
         super().__init__(msg)
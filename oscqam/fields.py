@@ -1,4 +1,5 @@
 from enum import Enum
+from operator import itemgetter
 
 from .errors import ReportedError
 
@@ -58,7 +59,7 @@ class InvalidFieldsError(ReportedError):
                 (str(field), levenshtein(str(field), bad_field))
                 for field in ReportField
             ]
-            nearest = min(distances, key=lambda d: d[1])
+            nearest = min(distances, key=itemgetter(1))
             suggestions.add(nearest[0])
         return suggestions
 
@@ -89,14 +90,17 @@ class ReportField(Enum):
 
     @classmethod
     def from_str(cls, field):
-        for f in cls:
-            if f.value[1] == field:
-                return f
-        raise InvalidFieldsError([field])
+        try:
+            return _fields_by_log_key[field]
+        except KeyError:
+            raise InvalidFieldsError([field]) from None
+
+
+_fields_by_log_key = {f.log_key: f for f in ReportField}
 
 
 class ReportFields:
-    all_fields = [
+    all_fields = (
         ReportField.review_request_id,
         ReportField.products,
         ReportField.srcrpms,
@@ -109,7 +113,7 @@ class ReportFields:
         ReportField.incident_priority,
         ReportField.creator,
         ReportField.issues,
-    ]
+    )
 
     def fields(self, _):
         return self.all_fields
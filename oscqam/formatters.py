@@ -7,8 +7,6 @@ import struct
 import sys
 import termios
 
-import prettytable
-
 from .fields import ReportField
 
 
@@ -105,11 +103,21 @@ class Formatter:
         """
         pass
 
+    def write(self, keys, reports, out=None):
+        """Write the formatted reports to the out-stream.
+
+        Formatters that can produce their output piece by piece should
+        overwrite this to write it as it is generated.
+
+        :param out: Filelike to write to; defaults to stdout.
+        """
+        print(self.output(keys, reports), file=out)
+
     def formatter(self, key):
         return self._formatters.get(key, self.default_format)
 
     def comment_formatter(self, value):
-        return self.listsep.join([os_lineseps(str(v)) for v in value])
+        return self.listsep.join(os_lineseps(str(v)) for v in value)
 
     def list_formatter(self, value):
         return self.listsep.join(value)
@@ -126,20 +134,26 @@ class VerboseOutput(Formatter):
         super().__init__(",")
         self.record_sep = "-" * terminal_dimensions()[1]
 
-    def output(self, keys, reports):
-        output = []
-        str_template = "{{0:{length}s}}: {{1}}".format(
-            length=max([len(str(k)) for k in keys])
-        )
+    def records(self, keys, reports):
+        """Generate the blocks for the reports, each followed by a separator."""
+        length = max(len(str(k)) for k in keys)
+        columns = [
+            (key, str(key).ljust(length) + ": ", self.formatter(key)) for key in keys
+        ]
         for report in reports:
-            values = []
-            for key in keys:
-                formatter = self.formatter(key)
-                value = formatter(report.value(key))
-                values.append(str_template.format(str(key), value))
-            output.append(os.linesep.join(values))
-            output.append(self.record_sep)
-        return os.linesep.join(output)
+            yield os.linesep.join(
+                label + str(formatter(report.value(key)))
+                for key, label, formatter in columns
+            )
+            yield self.record_sep
+
+    def output(self, keys, reports):
+        return os.linesep.join(self.records(keys, reports))
+
+    def write(self, keys, reports, out=None):
+        write = (out or sys.stdout).write
+        for record in self.records(keys, reports):
+            write(record + os.linesep)
 
 
 class TabularOutput(Formatter):
@@ -156,14 +170,15 @@ class TabularOutput(Formatter):
         super().__init__(os.linesep, {ReportField.comments: self.comment_formatter})
 
     def output(self, keys, reports):
+        # Only needed for tabular listings: most commands never print a table.
+        import prettytable
+
         table_formatter = prettytable.PrettyTable(keys)
         table_formatter.align = "l"
         table_formatter.border = True
+        columns = [(key, self.formatter(key)) for key in keys]
         for report in reports:
-            values = []
-            for key in keys:
-                formatter = self.formatter(key)
-                value = formatter(report.value(key))
-                values.append(value)
-            table_formatter.add_row(values)
+            table_formatter.add_row(
+                [formatter(report.value(key)) for key, formatter in columns]
+            )
         return table_formatter
@@ -57,13 +57,13 @@ class Assignment:
         for event in events:
             user = remote.users.by_name(event.who)
             if event.get_description() == cls.ACCEPTED_DESC:
-                logging.debug("Assignment for: %s -> %s" % (group, user))
+                logging.debug("Assignment for: %s -> %s", group, user)
                 assignments.add(Assignment(user, group))
             elif event.get_description() == cls.REOPENED_DESC:
-                logging.debug("Unassignment for: %s -> %s" % (group, user))
+                logging.debug("Unassignment for: %s -> %s", group, user)
                 assignments.remove(Assignment(user, group))
             else:
-                logging.debug("Unknown event: %s " % event.get_description())
+                logging.debug("Unknown event: %s ", event.get_description())
         return assignments
 
     @classmethod
@@ -109,11 +109,11 @@ class Assignment:
             removal = [a for a in assignments if a.user == user_review.reviewer]
 
             if removal:
-                logging.debug("Removing assignments %s as they are finished" % removal)
+                logging.debug("Removing assignments %s as they are finished", removal)
 
                 for r in removal:
                     assignments.remove(r)
 
         if not assignments:
-            logging.debug("No assignments could be found for %s" % request)
+            logging.debug("No assignments could be found for %s", request)
         return list(assignments)
@@ -25,7 +25,7 @@ class OBSGroupFilter(GroupFilter):
 
 
 class IBSGroupFilter(GroupFilter):
-    IGNORED_GROUPS = ["qam-auto", "qam-openqa"]
+    IGNORED_GROUPS = frozenset(["qam-auto", "qam-openqa"])
 
     """Methods that allow filtering on groups from IBS."""
 
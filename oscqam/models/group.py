@@ -10,6 +10,7 @@ class Group(XmlFactoryMixin, Reviewer):
         super().__init__(remote, attributes, children)
         self.remote = remote
         self.filter = GroupFilter.for_remote(remote)
+        self._is_qam_group = None
         if "title" in children:
             # We set name to title to ensure equality.  This allows us to
             # prevent having to query *all* groups we need via this method,
@@ -28,7 +29,9 @@ class Group(XmlFactoryMixin, Reviewer):
         # 'qam-auto' is already used to designate automated reviews:
         # It is excluded here, as it does not require manual review
         # by a QAM member.
-        return self.filter.is_qam_group(self)
+        if self._is_qam_group is None:
+            self._is_qam_group = self.filter.is_qam_group(self)
+        return self._is_qam_group
 
     def __hash__(self):
         # We don't want to hash to the same as only the string.
@@ -34,16 +34,21 @@ class Request(osc.core.Request, XmlFactoryMixin):
         super().__init__()
         self._comments = None
         self._groups = None
+        self._group_set = None
         self._packages = None
         self._assigned_roles = None
+        self._assigned_roles_by_user = None
         self._priority = None
-        self._reviews = []
+        self._reviews = None
+        self._open_reviews = None
         self._attributes = {}
-        self._issues = []
+        self._issues = None
+        self._creator = None
         self._incident = None
+        self._templates = {}
 
     def active(self):
-        return self.state == "new" or self.state == "review"
+        return self.state.name in Request.OPEN_STATES
 
     @property
     def incident_priority(self):
@@ -59,10 +64,23 @@ class Request(osc.core.Request, XmlFactoryMixin):
 
     @property
     def assigned_roles(self):
-        if not self._assigned_roles:
+        if self._assigned_roles is None:
             self._assigned_roles = Assignment.infer(self.remote, self)
         return self._assigned_roles
 
+    @property
+    def assigned_roles_by_user(self):
+        """The assigned roles indexed by the login of the assigned user.
+
+        :returns: {str: [:class:`oscqam.models.Assignment`]}
+        """
+        if self._assigned_roles_by_user is None:
+            roles = {}
+            for role in self.assigned_roles:
+                roles.setdefault(role.user.login, []).append(role)
+            self._assigned_roles_by_user = roles
+        return self._assigned_roles_by_user
+
     @property
     def comments(self):
         if not self._comments:
@@ -71,18 +89,19 @@ class Request(osc.core.Request, XmlFactoryMixin):
 
     @property
     def maker(self):
-        for history in self.statehistory:
-            if history.description == "Request created":
-                self._creator = self.remote.users.by_name(history.who)
-                break
-        else:
-            self._creator = "Unknown"
+        if self._creator is None:
+            for history in self.statehistory:
+                if history.description == "Request created":
+                    self._creator = self.remote.users.by_name(history.who)
+                    break
+            else:
+                self._creator = "Unknown"
         return self._creator
 
     @property
     def issues(self):
         """Bugs that should be fixed as part of this request"""
-        if not self._issues:
+        if self._issues is None:
             self._issues = self.remote.bugs.for_request(self)
         return self._issues
 
@@ -96,10 +115,17 @@ class Request(osc.core.Request, XmlFactoryMixin):
             if isinstance(review, GroupReview)
         ]
 
+    @property
+    def group_set(self):
+        """The groups reviewing this request, for membership tests."""
+        if self._group_set is None:
+            self._group_set = frozenset(self.groups)
+        return self._group_set
+
     @property
     def packages(self):
         """Collects all packages of the actions that are part of the request."""
-        if not self._packages:
+        if self._packages is None:
             packages = set()
             for action in self.actions:
                 pkg = action.src_package
@@ -148,16 +174,57 @@ class Request(osc.core.Request, XmlFactoryMixin):
         url = "/".join([self.remote.requests.endpoint, self.reqid])
         url += "?" + url_params
         self.remote.post(url, comment)
+        self.remote.requests.invalidate(self.reqid)
 
     def review_assign(self, group, reviewer, comment=None):
         params = {"cmd": "assignreview", "reviewer": reviewer.login}
         self.review_action(params, group=group, comment=comment)
 
+    def _review_many(self, review_method, groups, reviewer, comments, report=None):
+        """Call the review method for several groups, one after the other.
+
+        The calls stop at the first error, so the groups handled before it
+        are exactly the ones that were changed on the remote.
+
+        :param comments: One comment per group.
+
+        :param report: Called with each group and the error raised for it
+            (None on success) after its call.
+        :type report: (:class:`oscqam.models.Group`, Exception) -> None
+        """
+        for group, comment in zip(groups, comments):
+            try:
+                review_method(group, reviewer, comment)
+            except Exception as e:
+                if report:
+                    report(group, e)
+                raise
+            if report:
+                report(group, None)
+
+    def review_assign_many(self, groups, reviewer, comments, report=None):
+        """Assign the reviewer for several groups.
+
+        :param comments: One comment per group.
+
+        :param report: See :meth:`_review_many`.
+        """
+        self._review_many(self.review_assign, groups, reviewer, comments, report)
+
     def review_unassign(self, group, reviewer, comment=None):
         """Will undo the assignment by the group"""
         params = {"cmd": "assignreview", "revert": 1, "reviewer": reviewer.login}
         self.review_action(params, group=group, comment=comment)
 
+    def review_unassign_many(self, groups, reviewer, comments, report=None):
+        """Undo the assignment of the reviewer for several groups.
+
+        :param comments: One comment per group.
+
+        :param report: See :meth:`_review_many`.
+        """
+        self._review_many(self.review_unassign, groups, reviewer, comments, report)
+
     def review_accept(self, user=None, group=None, comment=None):
         comment = self._format_review_comment(comment)
         params = {"cmd": "changereviewstate", "newstate": "accepted"}
@@ -217,17 +284,25 @@ class Request(osc.core.Request, XmlFactoryMixin):
 
     def review_list(self):
         """Returns all reviews as a list."""
-        if not self._reviews:
+        if self._reviews is None:
+            # Build the list before publishing it: requests are shared between
+            # the threads that filter and load reports.
+            reviews = []
             for review in self.reviews:
                 if review.by_group:
-                    self._reviews.append(GroupReview(self.remote, review))
+                    reviews.append(GroupReview(self.remote, review))
                 elif review.by_user:
-                    self._reviews.append(UserReview(self.remote, review))
+                    reviews.append(UserReview(self.remote, review))
+            self._reviews = reviews
         return self._reviews
 
     def review_list_open(self):
         """Return only open reviews."""
-        return [r for r in self.review_list() if r.state in Request.OPEN_STATES]
+        if self._open_reviews is None:
+            self._open_reviews = [
+                r for r in self.review_list() if r.state in Request.OPEN_STATES
+            ]
+        return self._open_reviews
 
     def review_list_accepted(self):
         return [r for r in self.review_list() if r.state.lower() == "accepted"]
@@ -236,12 +311,19 @@ class Request(osc.core.Request, XmlFactoryMixin):
         """Adds a comment to this request."""
         endpoint = "/comments/request/{id}".format(id=self.reqid)
         self.remote.post(endpoint, comment)
+        self.remote.requests.invalidate(self.reqid)
 
     def get_template(self, template_factory):
-        """Return the template associated with this request."""
+        """Return the template associated with this request.
+
+        Templates are cached per factory, so that several actions working on
+        the same request only load the template once.
+        """
         if not self.src_project:
             raise MissingSourceProjectError(self)
-        return template_factory(self)
+        if template_factory not in self._templates:
+            self._templates[template_factory] = template_factory(self)
+        return self._templates[template_factory]
 
     @classmethod
     def filter_by_project(cls, request_substring, requests):
@@ -1,28 +1,54 @@
-class Review:
-    """Base class for buildservice-review objects."""
+import abc
+
+
+class Review(metaclass=abc.ABCMeta):
+    """Base class for buildservice-review objects.
+
+    The reviewer is only looked up on the remote when it is first accessed,
+    so that reviews can be filtered by :attr:`name` without a request.
+    """
 
     OPEN_STATES = ("new", "review")
     CLOSED_STATES = ("accepted",)
 
-    def __init__(self, remote, review, reviewer):
+    def __init__(self, remote, review, name):
         self._review = review
+        self._reviewer = None
         self.remote = remote
-        self.reviewer = reviewer
+        self.name = name
         self.state = review.state.lower()
         self.open = self.state in self.OPEN_STATES
         self.closed = self.state in self.CLOSED_STATES
 
+    @property
+    def reviewer(self):
+        if not self._reviewer:
+            self._reviewer = self._load_reviewer()
+        return self._reviewer
+
+    @abc.abstractmethod
+    def _load_reviewer(self):
+        """Look up the reviewer of this review on the remote.
+
+        :returns: :class:`oscqam.models.Reviewer`
+        """
+        pass
+
     def __str__(self):
         return "Review: {0} ({1})".format(self.reviewer, self.state)
 
 
 class GroupReview(Review):
     def __init__(self, remote, review):
-        reviewer = remote.groups.for_name(review.by_group)
-        super().__init__(remote, review, reviewer)
+        super().__init__(remote, review, review.by_group)
+
+    def _load_reviewer(self):
+        return self.remote.groups.for_name(self.name)
 
 
 class UserReview(Review):
     def __init__(self, remote, review):
-        reviewer = remote.users.by_name(review.by_user)
-        super().__init__(remote, review, reviewer)
+        super().__init__(remote, review, review.by_user)
+
+    def _load_reviewer(self):
+        return self.remote.users.by_name(self.name)
@@ -81,10 +81,10 @@ class Template:
 
     @property
     def status(self):
-        summary = self.log_entries["SUMMARY"]
-        if summary.upper() == "PASSED":
+        summary = self.log_entries["SUMMARY"].upper()
+        if summary == "PASSED":
             return Template.STATUS_SUCCESS
-        elif summary.upper() == "FAILED":
+        elif summary == "FAILED":
             return Template.STATUS_FAILURE
         return Template.STATUS_UNKNOWN
 
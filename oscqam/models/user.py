@@ -11,6 +11,7 @@ class User(XmlFactoryMixin, Reviewer):
         super().__init__(remote, attributes, children)
         self.remote = remote
         self._groups = None
+        self._qam_group_names = None
 
     @property
     def groups(self):
@@ -26,6 +27,13 @@ class User(XmlFactoryMixin, Reviewer):
         """Return only the groups that are part of the qam-workflow."""
         return [group for group in self.groups if group.is_qam_group()]
 
+    @property
+    def qam_group_names(self):
+        """Names of the groups in :attr:`qam_groups` for membership tests."""
+        if self._qam_group_names is None:
+            self._qam_group_names = frozenset(group.name for group in self.qam_groups)
+        return self._qam_group_names
+
     def reviewable_groups(self, request):
         """Return groups the user could review for the given request.
 
@@ -34,31 +42,27 @@ class User(XmlFactoryMixin, Reviewer):
 
         :returns: set(:class:`oscqam.models.Group`)
         """
-        user_groups = set(self.qam_groups)
+        user_groups = self.qam_group_names
         reviews = [
             review
             for review in request.review_list()
-            if (
-                isinstance(review, GroupReview)
-                and review.open
-                and review.reviewer.is_qam_group()
-            )
+            if isinstance(review, GroupReview) and review.open
         ]
-        if not reviews:
-            raise NoQamReviewsError(reviews)
-        review_groups = [review.reviewer for review in reviews]
-        open_groups = set(review_groups)
-        both = user_groups.intersection(open_groups)
+        # Match on the group names first: the open reviews are few compared
+        # to the user's groups, and the reviewing groups then only need to be
+        # loaded from the remote when nothing matches (for the error message).
+        both = {review.reviewer for review in reviews if review.name in user_groups}
         if not both:
-            raise NonMatchingUserGroupsError(self, user_groups, open_groups)
+            reviews = [review for review in reviews if review.reviewer.is_qam_group()]
+            if not reviews:
+                raise NoQamReviewsError(reviews)
+            open_groups = {review.reviewer for review in reviews}
+            raise NonMatchingUserGroupsError(self, self.qam_groups, open_groups)
         return both
 
     def in_review_groups(self, request):
-        reviewing_groups = []
-        for role in request.assigned_roles:
-            if role.user == self:
-                reviewing_groups.append(role.group)
-        return reviewing_groups
+        roles = request.assigned_roles_by_user.get(self.login, [])
+        return [role.group for role in roles]
 
     def is_qam_group(self):
         return False
@@ -6,9 +6,12 @@ from json import loads
 from json.decoder import JSONDecodeError
 import logging
 import re
+import sys
 
 from .domains import Rating
 
+SLE_PREFIX_RE = re.compile("^SLE-")
+
 
 def until(snippet, lines):
     """Return lines until the snippet is matched at the beginning of the line.
@@ -49,7 +52,8 @@ def split_products(product_line):
         p if p.endswith(")") else p + ")"
         for p in (l.strip() for l in product_line.split("),"))
     )
-    return [re.sub("^SLE-", "", product, 1) for product in products]
+    # The same few products appear in most templates of a listing.
+    return [sys.intern(SLE_PREFIX_RE.sub("", product, 1)) for product in products]
 
 
 def split_srcrpms(srcrpm_line):
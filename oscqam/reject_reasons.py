@@ -74,17 +74,21 @@ class RejectReason(Enum):
 
     @classmethod
     def from_str(cls, field):
-        for f in cls:
-            if f.value[1] == field:
-                return f
-        raise InvalidRejectError([field])
+        try:
+            return _reasons_by_flag[field]
+        except KeyError:
+            raise InvalidRejectError([field]) from None
 
     @classmethod
     def from_id(cls, id):
-        ids = [e.enum_id for e in RejectReason]
-        for f in cls:
-            if f.value[0] == id:
-                return f
-        raise ValueError(
-            "Enum for id not found {0}. " "Valid ids: {1} ".format(id, ids)
-        )
+        try:
+            return _reasons_by_id[id]
+        except KeyError:
+            raise ValueError(
+                "Enum for id not found {0}. "
+                "Valid ids: {1} ".format(id, list(_reasons_by_id))
+            ) from None
+
+
+_reasons_by_flag = {r.flag: r for r in RejectReason}
+_reasons_by_id = {r.enum_id: r for r in RejectReason}
@@ -1,6 +1,7 @@
 from functools import lru_cache
 
 from ..models import Group
+from ..utils import thread_pool
 
 
 class GroupRemote:
@@ -13,6 +14,11 @@ class GroupRemote:
         group_entries = Group.parse_entry(self.remote, self.remote.get(self.endpoint))
         return group_entries
 
+    @lru_cache(maxsize=None)
+    def qam_groups(self):
+        """Return all groups that are part of the qam-workflow."""
+        return [group for group in self.all() if group.is_qam_group()]
+
     def for_pattern(self, pattern):
         return [group for group in self.all() if pattern.match(group.name)]
 
@@ -25,6 +31,14 @@ class GroupRemote:
         else:
             raise AttributeError("No group found for name: {0}".format(group_name))
 
+    def for_names(self, group_names):
+        """Return the groups for the given names.
+
+        The build service has no call to load several groups at once, so they
+        are loaded concurrently.
+        """
+        return list(thread_pool().map(self.for_name, group_names))
+
     @lru_cache(maxsize=None)
     def for_user(self, user):
         params = {"login": user.login}
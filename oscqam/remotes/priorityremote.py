@@ -1,7 +1,6 @@
 from urllib.error import HTTPError
 from xml.etree import ElementTree as ET
 
-import requests
 import urllib3
 import urllib3.exceptions
 
@@ -34,6 +33,10 @@ class PriorityRemote:
                 return self._smelt_prio(request)
 
     def _smelt_prio(self, request):
+        # Only needed when the build service has no priority: importing
+        # requests noticeably slows down the start of every command.
+        import requests
+
         try:
             prio = requests.get(
                 self.smelt,
@@ -7,6 +7,7 @@ class RequestRemote:
     def __init__(self, remote):
         self.remote = remote
         self.endpoint = "request"
+        self._requests = {}
 
     def _group_xpath(self, groups, state):
         """Search the given groups with the given state."""
@@ -89,9 +90,21 @@ class RequestRemote:
         ]
 
     def by_id(self, req_id):
+        """Return the request with the given id.
+
+        Requests are cached, so that several actions working on the same
+        request share one object and only load it once.  Call
+        :meth:`invalidate` after changing a request on the remote.
+        """
         req_id = Request.parse_request_id(req_id)
-        endpoint = "/".join([self.endpoint, req_id])
-        req = Request.parse(
-            self.remote, self.remote.get(endpoint, {"withfullhistory": 1})
-        )
-        return req[0]
+        if req_id not in self._requests:
+            endpoint = "/".join([self.endpoint, req_id])
+            req = Request.parse(
+                self.remote, self.remote.get(endpoint, {"withfullhistory": 1})
+            )
+            self._requests[req_id] = req[0]
+        return self._requests[req_id]
+
+    def invalidate(self, req_id):
+        """Drop the cached request with the given id."""
+        self._requests.pop(Request.parse_request_id(req_id), None)
@@ -1,33 +1,67 @@
-from itertools import groupby
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import logging
+import os
 import ssl
 from urllib.error import HTTPError
 from urllib.request import urlopen
 
+THREAD_POOL_WORKERS = 16
+_thread_pool = None
 
-def https(url):
+
+def thread_pool_workers():
+    """Return the number of workers of the shared thread pool.
+
+    The number of workers can be set with the ``OSCQAM_WORKERS`` environment
+    variable; it defaults to :data:`THREAD_POOL_WORKERS`, which is also used
+    if the variable is not a positive integer.
+    """
+    value = os.environ.get("OSCQAM_WORKERS")
+    if value is None:
+        return THREAD_POOL_WORKERS
     try:
-        ctx = ssl.create_default_context()
-        return urlopen(url, context=ctx)
-    except HTTPError:
-        return None
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logging.warning(
+            "Invalid OSCQAM_WORKERS value %r: using %d workers.",
+            value,
+            THREAD_POOL_WORKERS,
+        )
+        return THREAD_POOL_WORKERS
+    return workers
 
 
-def multi_level_sort(xs, criteria):
-    """Sort the given collection based on multiple criteria.
-    The criteria will be sorted by in the given order, whereas each group
-    from the first criteria will be sorted by the second criteria and so forth.
+def thread_pool():
+    """Return the thread pool used for concurrent remote calls.
 
-    :param xs: Iterable of objects.
-    :type xs: [a]
+    The pool is created on first use and shared for the lifetime of the
+    process, so that repeated actions do not have to start new threads.
 
-    :param criteria: Iterable of extractor functions.
-    :type criteria: [a -> b]
+    The number of workers is given by :func:`thread_pool_workers`.
 
+    Tasks running in the pool must not wait on other tasks submitted to it.
+
+    :returns: :class:`concurrent.futures.ThreadPoolExecutor`
     """
-    if not criteria:
-        return xs
-    extractor = criteria[-1]
-    xss = sorted(xs, key=extractor)
-    grouped = groupby(xss, extractor)
-    subsorts = (multi_level_sort(list(value), criteria[:-1]) for _, value in grouped)
-    return [s for sub in subsorts for s in sub]
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=thread_pool_workers())
+        atexit.register(_thread_pool.shutdown)
+    return _thread_pool
+
+
+@lru_cache(maxsize=None)
+def _ssl_context():
+    # Loading the system CA certificates is costly; the context can be shared.
+    return ssl.create_default_context()
+
+
+def https(url):
+    try:
+        return urlopen(url, context=_ssl_context())
+    except HTTPError:
+        return None
@@ -1,10 +1,12 @@
 from io import StringIO
+from types import SimpleNamespace
 
 import pytest
 
 from oscqam import actions, errors, fields, models, reject_reasons, remotes
 from oscqam.actions.oscaction import OscAction
 from oscqam.actions.report import Report
+from oscqam.domains import Priority, Rating
 
 from .utils import FakeTrGetter, create_template_data, load_fixture
 
@@ -15,8 +17,11 @@ class UndoAction(OscAction):
         self.undo_stack = []
         self.undos = []
 
+    def undo(self, value):
+        self.undos.append(value)
+
     def action(self):
-        self.undo_stack.append(lambda: self.undos.append(1))
+        self.undo_stack.append((self.undo, {"value": 1}))
         raise remotes.RemoteError(None, None, None, None, None)
 
 
@@ -44,6 +49,27 @@ def test_undo():
     assert u.undos == [1]
 
 
+def test_remote_error_logged(caplog):
+    u = UndoAction()
+    u()
+    assert [r.levelname for r in caplog.records] == ["ERROR"]
+
+
+def test_action_output_written_once(remote):
+    class CountingIO(StringIO):
+        writes = 0
+
+        def write(self, s):
+            self.writes += 1
+            return super().write(s)
+
+    out = CountingIO()
+    unassign = actions.UnassignAction(remote, user_id, two_assigned, out=out)
+    unassign()
+    assert out.writes == 1
+    assert out.getvalue().count("Unassigning") == 2
+
+
 def test_infer_no_groups_match(remote):
     assign_action = actions.AssignAction(remote, user_id, cloud_open)
     with pytest.raises(errors.NonMatchingUserGroupsError):
@@ -96,6 +122,11 @@ def test_unassign_inferred_group(remote):
     assert len(remote.post_calls) == 1
 
 
+def test_unassign_review_groups_cached(remote):
+    unassign = actions.UnassignAction(remote, user_id, assigned)
+    assert unassign.groups() is unassign.review_groups()
+
+
 def test_unassign_subset_group(remote):
     out = StringIO()
     unassign = actions.UnassignAction(
@@ -296,6 +327,49 @@ def test_list_assigned(remote):
     assert len(requests) == 1
 
 
+def test_list_group(remote):
+    action = actions.ListGroupAction(remote, "anonymous", ["qam-cloud"])
+    requests = action.load_requests()
+    assert requests
+    assert all(isinstance(request, models.Request) for request in requests)
+
+
+def test_list_open_includes_assigned_requests(remote):
+    collection = "<collection>{0}{1}</collection>".format(
+        load_fixture("request_twoassigned.xml"), load_fixture("request_12345.xml")
+    )
+    remote.register_url(
+        "request",
+        lambda: collection,
+        {
+            "user": "anonymous",
+            "view": "collection",
+            "states": "new,review",
+            "withfullhistory": "1",
+        },
+    )
+    action = actions.ListOpenAction(remote, "anonymous")
+    requests = {request.reqid: request for request in action.load_requests()}
+    assert "twoassigned" in requests
+    assert "anonymous" in requests["twoassigned"].origin
+
+
+def test_in_review_by_user(remote):
+    reviews = remote.requests.by_id(cloud_open).review_list()
+    assert actions.ListAssignedAction(remote, "anonymous").in_review_by_user(reviews)
+    assert not actions.ListAssignedAction(remote, "anonymous2").in_review_by_user(
+        reviews
+    )
+
+
+def test_in_review_by_group(remote):
+    reviews = remote.requests.by_id(cloud_open).review_list()
+    action = actions.ListAssignedGroupAction(remote, "anonymous", ["qam-cloud"])
+    assert action.in_review(reviews)
+    action = actions.ListAssignedGroupAction(remote, "anonymous", ["qam-test"])
+    assert not action.in_review(reviews)
+
+
 def test_approval_requires_status_passed(remote):
     request = remote.requests.by_id(cloud_open)
     report = create_template_data(
@@ -340,9 +414,85 @@ def test_load_requests_with_exception(remote):
     request_1 = remote.requests.by_id(cloud_open)
     request_2 = remote.requests.by_id(non_open)
     request_2.get_template = raise_template_not_found
+    endpoint = "/source/SUSE:Maintenance:130/_attribute/OBS:IncidentPriority"
+    remote.register_url(endpoint, lambda: load_fixture("incident_priority.xml"))
     action = actions.ListOpenAction(remote, "anonymous", template_factory=lambda r: r)
     requests = list(action._load_listdata([request_1, request_2]))
     assert len(requests) == 1
+    # The priority is needed for sorting and is fetched along with the template.
+    assert request_1._priority
+
+
+def test_load_listdata_loads_values(remote):
+    request = remote.requests.by_id(cloud_open)
+    template = models.Template(
+        request, tr_getter=FakeTrGetter(create_template_data(SUMMARY="PASSED"))
+    )
+    endpoint = "/source/SUSE:Maintenance:130/_attribute/OBS:IncidentPriority"
+    remote.register_url(endpoint, lambda: load_fixture("incident_priority.xml"))
+    action = actions.ListOpenAction(
+        remote, "anonymous", template_factory=lambda _: template
+    )
+    keys = [fields.ReportField.assigned_roles, fields.ReportField.products]
+    [report] = action._load_listdata([request], keys)
+    assert set(report._values) == {fields.ReportField.incident_priority, *keys}
+
+
+def test_merge_requests_origin(remote):
+    request_1 = remote.requests.by_id(cloud_open)
+    request_2 = remote.requests.by_id(non_open)
+    action = actions.ListOpenAction(remote, "anonymous")
+    merged = action.merge_requests({request_1}, {request_1, request_2})
+    assert merged == {request_1, request_2}
+    assert request_1.origin == ["anonymous"] + request_1.groups
+    assert request_2.origin == request_2.groups
+
+
+def test_filter_requests(remote):
+    request_1 = remote.requests.by_id(cloud_open)
+    request_2 = remote.requests.by_id(non_open)
+    action = actions.ListOpenAction(remote, "anonymous")
+    filtered = action.filter_requests(
+        [request_1, request_2], lambda request: request is request_2
+    )
+    assert filtered == {request_2}
+
+
+def sort_report(priority, rating, reqid):
+    template = SimpleNamespace(log_entries={"Rating": rating})
+    request = SimpleNamespace(
+        incident_priority=priority,
+        reqid=reqid,
+        get_template=lambda factory: template,
+    )
+    return Report(request, None)
+
+
+def test_group_sort_reports(remote):
+    def report(priority, rating, reqid):
+        return sort_report(Priority(priority), Rating(rating), reqid)
+
+    low = report(100, "critical", "1")
+    high_moderate = report(500, "moderate", "2")
+    high_critical_3 = report(500, "critical", "3")
+    high_critical_4 = report(500, "critical", "4")
+    action = actions.ListOpenAction(remote, "anonymous")
+    action.reports = [low, high_critical_4, high_moderate, high_critical_3]
+    action.group_sort_reports()
+    assert action.reports == [high_critical_3, high_critical_4, high_moderate, low]
+
+
+def test_group_sort_reports_numeric_id(remote):
+    def report(reqid):
+        return sort_report(Priority(100), Rating("low"), reqid)
+
+    nine = report("9")
+    ten = report("10")
+    action = actions.ListOpenAction(remote, "anonymous")
+    action.reports = [ten, nine]
+    action.group_sort_reports()
+    assert action.reports == [nine, ten]
+    assert nine.sort_key is nine.sort_key
 
 
 def test_remove_comment(remote):
@@ -351,6 +501,13 @@ def test_remove_comment(remote):
     assert len(remote.delete_calls) == 1
 
 
+def test_remove_comment_does_not_load_user(remote):
+    # There is no fixture for this user: loading it would fail.
+    action = actions.DeleteCommentAction(remote, "nobody", "0")
+    action()
+    assert len(remote.delete_calls) == 1
+
+
 def test_assign_previous_reject_not_old_reviewer(remote):
     remote.register_url(
         "request",
@@ -368,12 +525,10 @@ def test_assign_previous_reject_not_old_reviewer(remote):
         groups=["qam-test"],
         template_factory=lambda r: r,
     )
-    with pytest.raises(errors.NotPreviousReviewerError):
+    with pytest.raises(errors.NotPreviousReviewerError, match="reviewers: anonymous."):
         assign()
 
 
-# TODO: FIX thix
-@pytest.mark.skip("Broken test - maybe wrong fixture")
 def test_assign_previous_reject_old_reviewer(remote):
     out = StringIO()
     remote.register_url(
@@ -477,6 +632,17 @@ def test_report(remote):
         "update-test-trival.SUSE_SLE-12_Update"
     ]
     assert report.value(fields.ReportField.unassigned_roles) == ["qam-cloud"]
+    assert report.value(fields.ReportField.products) == template.log_entries["Products"]
+
+
+def test_report_values_cached(remote):
+    request = remote.requests.by_id(cloud_open)
+    template = models.Template(
+        request, tr_getter=FakeTrGetter(create_template_data(SUMMARY="PASSED"))
+    )
+    report = Report(request=request, template_factory=lambda _: template)
+    roles = report.value(fields.ReportField.assigned_roles)
+    assert report.value(fields.ReportField.assigned_roles) is roles
 
 
 def test_unassign_permission_error(remote):
@@ -723,3 +889,28 @@ def test_approve_misses_assigned_role(remote):
         )
         in approval.out.getvalue()
     )
+
+
+def test_unassign_partial_failure(remote):
+    def raiser():
+        raise remotes.RemoteError(None, None, None, None, None)
+
+    out = StringIO()
+    remote.register_url(
+        "request/twoassigned?cmd=assignreview&revert=1&reviewer=anonymous&"
+        "by_group=qam-cloud",
+        raiser,
+        "Unassigning Unknown User (anonymous@nowhere.none) from twoassigned "
+        "for group qam-cloud.",
+    )
+    unassign = actions.UnassignAction(
+        remote, user_id, two_assigned, groups=["qam-sle", "qam-cloud"], out=out
+    )
+    unassign()
+    assert out.getvalue().splitlines() == [
+        "Unassigning Unknown User (anonymous@nowhere.none) from twoassigned "
+        "for group qam-sle.",
+        "Could not unassign Unknown User (anonymous@nowhere.none) from "
+        "twoassigned for group qam-cloud.",
+    ]
+    assert len(remote.post_calls) == 1
@@ -1,10 +1,17 @@
 import builtins
 
 from contextlib import contextmanager
+from io import StringIO
+import os
+from types import SimpleNamespace
 
-from oscqam import formatters
-from oscqam.utils import multi_level_sort
+import pytest
+
+from oscqam import formatters, utils
 from oscqam.common import Common
+from oscqam.errors import ConflictingOptions, InvalidCommentIdError
+from oscqam.reject_reasons import RejectReason
+from oscqam.fields import ReportField
 
 
 @contextmanager
@@ -15,14 +22,18 @@ def wrap_builtin(answer):
     builtins.input = raw_input
 
 
-def test_multi_level_sort():
-    one = {"a": 0, "b": 1}
-    two = {"a": 0, "b": 0}
-    xs = [one, two]
-    criteria = [lambda x: x["b"], lambda x: x["a"]]
-    sortedxs = multi_level_sort(xs, criteria)
-    assert sortedxs[0] == two
-    assert sortedxs[1] == one
+def test_thread_pool_workers(monkeypatch):
+    monkeypatch.setattr(utils, "_thread_pool", None)
+    monkeypatch.setenv("OSCQAM_WORKERS", "3")
+    pool = utils.thread_pool()
+    assert pool._max_workers == 3
+    assert utils.thread_pool() is pool
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-2"])
+def test_thread_pool_workers_invalid(monkeypatch, value):
+    monkeypatch.setenv("OSCQAM_WORKERS", value)
+    assert utils.thread_pool_workers() == utils.THREAD_POOL_WORKERS
 
 
 def test_lineseperators():
@@ -32,6 +43,36 @@ def test_lineseperators():
     assert line == "Test\r\n"
 
 
+def fake_reports():
+    values = {ReportField.review_request_id: "1", ReportField.products: ["a", "b"]}
+    return list(values), [SimpleNamespace(value=values.get)]
+
+
+def test_verbose_output():
+    keys, reports = fake_reports()
+    output = formatters.VerboseOutput().output(keys, reports)
+    assert output.splitlines()[:2] == ["ReviewRequestID: 1", "Products       : a,b"]
+
+
+def test_verbose_write_matches_output():
+    keys, reports = fake_reports()
+    verbose = formatters.VerboseOutput()
+    out = StringIO()
+    verbose.write(keys, reports * 2, out)
+    assert out.getvalue() == verbose.output(keys, reports * 2) + os.linesep
+
+
+def test_tabular_output():
+    keys, reports = fake_reports()
+    table = formatters.TabularOutput().output(keys, reports)
+    assert table.rows == [["1", "a\nb"]]
+
+
+def test_invalid_comment_id_lists_ids():
+    error = InvalidCommentIdError("3", {"1": None, "2": None})
+    assert str(error) == "Id 3 is not in valid ids: 1, 2"
+
+
 def test_yes_no_question_true():
     interpreter = Common
     with wrap_builtin("yes"):
@@ -56,3 +97,49 @@ def test_yes_no_question_false():
     with wrap_builtin("nO"):
         result = interpreter.yes_no("Sure about that")
         assert result is False
+
+
+def test_query_enum_reprompts():
+    answers = iter(["x", "", "1, 999", "1, 2"])
+    raw_input = builtins.input
+    builtins.input = lambda _: next(answers)
+    try:
+        reasons = Common.query_enum(RejectReason, lambda r: r.enum_id, str)
+    finally:
+        builtins.input = raw_input
+    assert reasons == [RejectReason.from_id(1), RejectReason.from_id(2)]
+
+
+def test_query_enum_quit():
+    with wrap_builtin("q"):
+        result = Common.query_enum(RejectReason, lambda r: r.enum_id, str)
+    assert result == Common.SUBQUERY_QUIT
+
+
+def test_query_enum_single_member():
+    def fail(_):
+        raise AssertionError("Should not prompt")
+
+    reason = RejectReason.from_id(1)
+    raw_input = builtins.input
+    builtins.input = fail
+    try:
+        result = Common.query_enum([reason], lambda r: r.enum_id, str)
+    finally:
+        builtins.input = raw_input
+    assert result == [reason]
+
+
+def test_reject_reason_lookup():
+    reason = RejectReason.from_id(6)
+    assert RejectReason.from_str("tracking_issue") is reason
+    with pytest.raises(ValueError):
+        RejectReason.from_id(999)
+
+
+def test_check_exclusive():
+    args = SimpleNamespace(describe_fields=True, fields=["Rating"], user=None)
+    Common.check_exclusive(args, ("describe_fields", "-v"), ("user", "-U"))
+    with pytest.raises(ConflictingOptions) as error:
+        Common.check_exclusive(args, ("describe_fields", "-v"), ("fields", "-F"))
+    assert str(error.value) == "Only pass '-v' or '-F' not both"
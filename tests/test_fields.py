@@ -1,4 +1,6 @@
-from oscqam.fields import InvalidFieldsError, levenshtein
+import pytest
+
+from oscqam.fields import InvalidFieldsError, ReportField, levenshtein
 
 
 def test_insertion_levenshtein():
@@ -34,3 +36,8 @@ def test_suggestions():
     error = InvalidFieldsError(fields)
     suggestions = error._get_suggestions(fields)
     assert suggestions == set(["ReviewRequestID", "Bugs"])
+
+
+def test_unknown_field():
+    with pytest.raises(InvalidFieldsError):
+        ReportField.from_str("ReviewRequest")
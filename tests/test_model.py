@@ -5,7 +5,7 @@ import osc
 import pytest
 import responses
 
-from oscqam.domains import Priority, UnknownPriority
+from oscqam.domains import Priority, Rating, UnknownPriority
 from oscqam.errors import MissingSourceProjectError
 from oscqam.models import (
     Assignment,
@@ -17,6 +17,7 @@ from oscqam.models import (
     Template,
     User,
 )
+from oscqam.models.review import Review
 from oscqam.reject_reasons import RejectReason
 
 from .mockremote import MockRemote
@@ -221,6 +222,84 @@ def test_assignment_equality(remote):
     assert a1 == a2
 
 
+def test_request_by_id_cached(remote):
+    request = remote.requests.by_id("12345")
+    assert remote.requests.by_id("SUSE:Maintenance:130:12345") is request
+    request.review_accept(group=request.groups[0], comment="test")
+    assert remote.requests.by_id("12345") is not request
+
+
+def test_groups_for_names(remote):
+    groups = remote.groups.for_names(["qam-sle", "qam-test"])
+    assert [group.name for group in groups] == ["qam-sle", "qam-test"]
+
+
+def test_review_assign_many(remote):
+    request = remote.requests.by_id("12345")
+    user = remote.users.by_name("anonymous")
+    groups = [remote.groups.for_name("qam-sle"), remote.groups.for_name("qam-test")]
+    request.review_assign_many(groups, user, ["first", "second"])
+    assert len(remote.post_calls) == 2
+    assert any("by_group=qam-sle" in call for call in remote.post_calls)
+    assert any("by_group=qam-test" in call for call in remote.post_calls)
+
+
+def test_review_unassign_many(remote):
+    request = remote.requests.by_id("12345")
+    user = remote.users.by_name("anonymous")
+    groups = [remote.groups.for_name("qam-sle"), remote.groups.for_name("qam-test")]
+    request.review_unassign_many(groups, user, ["first", "second"])
+    assert len(remote.post_calls) == 2
+    assert all("revert=1" in call for call in remote.post_calls)
+
+
+def test_review_assign_many_stops_at_error(remote):
+    def raiser():
+        raise ValueError("qam-sle failed")
+
+    request = remote.requests.by_id("12345")
+    user = remote.users.by_name("anonymous")
+    groups = [
+        remote.groups.for_name("qam-test"),
+        remote.groups.for_name("qam-sle"),
+        remote.groups.for_name("qam-cloud"),
+    ]
+    remote.register_url(
+        "request/12345?cmd=assignreview&reviewer=anonymous&by_group=qam-sle",
+        raiser,
+        "second",
+    )
+    reported = []
+    with pytest.raises(ValueError):
+        request.review_assign_many(
+            groups,
+            user,
+            ["first", "second", "third"],
+            report=lambda group, error: reported.append((group.name, error)),
+        )
+    assert [name for name, _ in reported] == ["qam-test", "qam-sle"]
+    assert reported[0][1] is None
+    assert isinstance(reported[1][1], ValueError)
+    assert len(remote.post_calls) == 1
+
+
+def test_template_cached_per_factory(remote):
+    request = Request.parse(remote, req_1_xml)[0]
+    calls = []
+
+    def factory(request):
+        calls.append(request)
+        return Template(request, tr_getter=FakeTrGetter(template_txt))
+
+    assert request.get_template(factory) is request.get_template(factory)
+    assert len(calls) == 1
+
+
+def test_user_qam_group_names(remote):
+    user = User.parse(remote, user_txt)[0]
+    assert user.qam_group_names == frozenset(["qam-test", "qam-sle"])
+
+
 def test_assignment_inference_single_group(remote):
     """Test that assignments can be inferred from a single group even
     if the comments are not used.
@@ -233,6 +312,25 @@ def test_assignment_inference_single_group(remote):
     assert assignment.group.name == "qam-sle"
 
 
+def test_assigned_roles_by_user(remote):
+    request = Request.parse(remote, req_4_xml)[0]
+    roles = request.assigned_roles_by_user
+    assert list(roles) == ["anonymous"]
+    assert [role.group.name for role in roles["anonymous"]] == ["qam-sle"]
+
+
+def test_request_active(remote):
+    request = Request.parse(remote, req_1_xml)[0]
+    assert request.active()
+
+
+def test_empty_assigned_roles_cached(remote):
+    request = Request.parse(remote, req_unassigned)[0]
+    roles = request.assigned_roles
+    assert roles == []
+    assert request.assigned_roles is roles
+
+
 def test_assignment_inference_ignores_qam_auto(remote):
     request = Request.parse(remote, req_4_xml)[0]
     assignments = Assignment.infer(remote, request)
@@ -310,6 +408,13 @@ def test_priority_str():
     assert "100" == str(priority)
 
 
+def test_rating_order():
+    ratings = [Rating("low"), Rating("unknown"), Rating("critical"), Rating("")]
+    assert [str(r) for r in sorted(ratings)] == ["critical", "low", "", "unknown"]
+    assert Rating("moderate") <= Rating("moderate")
+    assert Rating("moderate") > Rating("important")
+
+
 def test_unassigned_roles(remote):
     request = Request.parse(remote, req_unassigned)[0]
     open_reviews = request.review_list_open()
@@ -318,6 +423,25 @@ def test_unassigned_roles(remote):
     assert open_reviews[1].reviewer.name == "qam-sle"
 
 
+def test_review_is_abstract(remote):
+    with pytest.raises(TypeError):
+        Review(remote, None, "anonymous")
+
+
+def test_review_list_cached(remote):
+    request = Request.parse(remote, req_unassigned)[0]
+    assert request.review_list() is request.review_list()
+    assert request.review_list_open() is request.review_list_open()
+
+
+def test_review_reviewer_loaded_lazily(remote):
+    request = Request.parse(remote, req_unassigned)[0]
+    review = request.review_list_open()[0]
+    assert review.name == "qam-cloud"
+    assert review._reviewer is None
+    assert review.reviewer == remote.groups.for_name("qam-cloud")
+
+
 def test_obs27_workaround_pre_152(remote):
     def raise_wrong_args(self, request):
         raise osc.oscerr.WrongArgs("acceptinfo")